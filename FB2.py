@@ -12,7 +12,7 @@ Features:
     - Compilation
     - Linking
     - Caching (skip unchanged files)
-    - Parallel “compiler daemons” (subprocess workers)
+    - Parallel “compiler daemons” (persistent worker processes)
 - Simple CLI:
     - init          -> create example project, copy self into project, create wrapper scripts
     - build         -> normal build
@@ -32,17 +32,24 @@ Windows-specific:
 """
 
 import argparse
+import asyncio
+import functools
 import hashlib
 import json
+import math
+import multiprocessing
 import os
+import pickle
+import queue
+import re
 import shutil
 import subprocess
 import sys
 import time
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 # --- TOML loading -----------------------------------------------------------
 
@@ -58,15 +65,39 @@ except ImportError:
 # --- Constants --------------------------------------------------------------
 
 DEFAULT_CONFIG_FILE = "forge.toml"
-CACHE_FILE = ".forgebuild2_cache.json"
+CACHE_FILE = ".forgebuild2_cache.pkl"
+HEADER_CACHE_FILE = ".forgebuild2_headers.pkl"
+CACHE_VERSION = 3
+LINK_CACHE_KEY = "__link__"  # BuildCache entry for the last link
 SUPPORTED_COMPILER = "clang++"
 WRAPPER_DIR = ".forgebuild2"
 WRAPPER_SCRIPT_NAME = "forgebuild2.py"
 WRAPPER_SH = "forgew"
 WRAPPER_BAT = "forgew.bat"
+HASH_CHUNK_SIZE = 1 << 20  # 1 MiB
+MAX_BATCH_SIZE = 4  # sources per compiler invocation
+STDERR_CHUNK_SIZE = 1 << 16  # 64 KiB reads of compiler stderr
 
 SELF_PATH = Path(__file__).resolve()
 
+# Wrapper script contents only depend on the constants above
+_WRAPPER_SH_BYTES = f"""#!/usr/bin/env sh
+# ForgeBuild_2 wrapper (Unix-like)
+DIR="$(CDPATH= cd -- "$(dirname "$0")" && pwd)"
+PYTHON="${{PYTHON:-python3}}"
+exec "$PYTHON" "$DIR/{WRAPPER_DIR}/{WRAPPER_SCRIPT_NAME}" "$@"
+""".encode("utf-8")
+
+_WRAPPER_BAT_BYTES = f"""@echo off
+REM ForgeBuild_2 wrapper (Windows)
+setlocal
+set DIR=%~dp0
+set PYTHON=%PYTHON%
+if "%PYTHON%"=="" set PYTHON=python
+"%PYTHON%" "%DIR%{WRAPPER_DIR}\\{WRAPPER_SCRIPT_NAME}" %*
+endlocal
+""".replace("\n", "\r\n").encode("utf-8")  # batch files want CRLF
+
 
 # --- Utility helpers --------------------------------------------------------
 
@@ -89,37 +120,77 @@ def colored(text: str, color: str) -> str:
     return f"{prefix}{text}{reset}"
 
 
-def read_file_bytes(path: Path) -> bytes:
-    with path.open("rb") as f:
-        return f.read()
+def _update_from_file(h: Any, path: Union[str, Path]) -> None:
+    with open(path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            h.update(chunk)
 
 
-def hash_source(
-    source_path: Path,
+def _compute_cfg_digest(
+    compiler_cmd: str,
     base_flags: List[str],
     profile_flags: List[str],
     include_dirs: List[str],
+) -> bytes:
+    """
+    Digest of the inputs shared by every source in a build. Computed once
+    per build and passed to hash_source, instead of re-encoding every flag
+    for every source.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for item in [compiler_cmd, *base_flags, *profile_flags, *include_dirs]:
+        h.update(item.encode("utf-8"))
+        h.update(b"\0")  # keeps ["-a", "b"] and ["-ab"] apart
+    return h.digest()
+
+
+@functools.lru_cache(maxsize=None)
+def _content_digest(path: Union[str, Path], mtime_ns: int, size: int) -> bytes:
+    """
+    BLAKE2b of a file's contents, streamed in chunks. mtime_ns and size are
+    part of the memo key only, so a file that changed on disk is re-read.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    _update_from_file(h, path)
+    return h.digest()
+
+
+def hash_source(
+    source_path: Path,
+    source_key: str,
+    cfg_digest: bytes,
+    mtime_ns: int,
+    size: int,
 ) -> str:
     """
     Hash representing:
-    - absolute path
-    - file contents
-    - base flags
-    - profile flags
-    - include dirs
+    - file contents (via _content_digest, so duplicates are read once)
+    - config digest (compiler, flags, include dirs), used as the key
+    - project-relative source path (see BuildConfig.resolved_sources)
     """
-    h = hashlib.sha256()
-    h.update(str(source_path.resolve()).encode("utf-8"))
-    h.update(read_file_bytes(source_path))
-    for flag in base_flags:
-        h.update(flag.encode("utf-8"))
-    for flag in profile_flags:
-        h.update(flag.encode("utf-8"))
-    for inc in include_dirs:
-        h.update(inc.encode("utf-8"))
+    h = hashlib.blake2b(digest_size=16, key=cfg_digest)
+    h.update(_content_digest(source_path, mtime_ns, size))
+    h.update(source_key.encode("utf-8"))
     return h.hexdigest()
 
 
+def parse_dep_file(dep_path: str) -> List[str]:
+    """
+    Returns the prerequisites of a Makefile-style `-MD` dependency file,
+    minus the first one (the source itself).
+    """
+    with open(dep_path, encoding="utf-8", errors="replace") as f:
+        text = f.read()
+    text = text.replace("\\\r\n", " ").replace("\\\n", " ")
+    rule = text.split("\n", 1)[0]
+    # The target ends at the first ':' followed by whitespace (not 'C:\')
+    match = re.search(r":\s", rule)
+    if match is None:
+        return []
+    deps = re.split(r"(?<!\\)\s+", rule[match.end():].strip())
+    return [dep.replace("\\ ", " ") for dep in deps[1:] if dep]
+
+
 # --- Config handling --------------------------------------------------------
 
 @dataclass
@@ -134,9 +205,11 @@ class BuildConfig:
     project: str
     version: str
     profile: BuildProfile
-    cpp_sources: List[str]
+    cpp_sources: List[Path]
+    resolved_sources: List[Tuple[Path, str]]  # (resolved path, cache key)
     compiler_cmd: str
     compiler_base_flags: List[str]
+    modules_enabled: bool
     include_dirs: List[str]
     output_dir: str
     binary_name: str
@@ -166,14 +239,28 @@ class BuildConfig:
         profile = BuildProfile(name=profile_name, flags=profile_flags)
 
         sources_section = raw.get("sources", {})
-        cpp_sources = sources_section.get("cpp", [])
+        cpp_sources = [Path(src) for src in sources_section.get("cpp", [])]
         if not cpp_sources:
             log(colored("Error: No C++ sources under [sources].cpp in forge.toml.", "red"))
             sys.exit(1)
 
+        # Normalize once here, without following symlinks; the cache key is
+        # the posix path relative to the project root (absolute only for
+        # sources outside it).
+        cwd = Path.cwd()
+        resolved_sources = []
+        for src in cpp_sources:
+            resolved = Path(os.path.normpath(os.path.join(cwd, src)))
+            try:
+                key = resolved.relative_to(cwd).as_posix()
+            except ValueError:
+                key = resolved.as_posix()
+            resolved_sources.append((resolved, key))
+
         compiler_section = raw.get("compiler", {})
         compiler_cmd = compiler_section.get("command", SUPPORTED_COMPILER)
         base_flags = compiler_section.get("flags", [])
+        modules_enabled = bool(compiler_section.get("modules", False))
 
         if compiler_cmd != SUPPORTED_COMPILER:
             log(colored(
@@ -193,8 +280,10 @@ class BuildConfig:
             version=version,
             profile=profile,
             cpp_sources=cpp_sources,
+            resolved_sources=resolved_sources,
             compiler_cmd=compiler_cmd,
             compiler_base_flags=base_flags,
+            modules_enabled=modules_enabled,
             include_dirs=include_dirs,
             output_dir=output_dir,
             binary_name=binary_name,
@@ -203,85 +292,393 @@ class BuildConfig:
 
 # --- Cache handling ---------------------------------------------------------
 
-class BuildCache:
+class PickleCache:
+    """
+    Dict of entries persisted as a versioned pickle file. Saving is a no-op
+    unless an entry changed since the last load/save.
+    """
+
     def __init__(self, path: Path):
         self.path = path
         self.data: Dict[str, Dict[str, Any]] = self._load()
+        self._dirty = False
 
     def _load(self) -> Dict[str, Dict[str, Any]]:
         if not self.path.exists():
             return {}
         try:
-            with self.path.open("r", encoding="utf-8") as f:
-                return json.load(f)
+            with self.path.open("rb") as f:
+                stored = pickle.load(f)
         except Exception:
             log(colored("Warning: Cache unreadable or corrupted. Ignoring it.", "yellow"))
             return {}
+        if not isinstance(stored, dict) or stored.get("v") != CACHE_VERSION:
+            return {}  # written by another ForgeBuild_2 version
+        return stored["entries"]
 
     def save(self) -> None:
-        with self.path.open("w", encoding="utf-8") as f:
-            json.dump(self.data, f, indent=2)
+        if not self._dirty:
+            return
+        # Write-then-rename, so an interrupted save never leaves a torn cache
+        tmp_path = self.path.with_suffix(".tmp")
+        with tmp_path.open("wb") as f:
+            pickle.dump({"v": CACHE_VERSION, "entries": self.data}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    def get_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        return self.data.get(key)
 
-    def get_entry(self, obj_path: Path) -> Optional[Dict[str, Any]]:
-        return self.data.get(str(obj_path))
+    def set_entry(self, key: str, entry: Dict[str, Any]) -> None:
+        self.data[key] = entry
+        self._dirty = True
 
-    def update_entry(self, obj_path: Path, source_hash: str) -> None:
-        self.data[str(obj_path)] = {
+
+class BuildCache(PickleCache):
+    def update_entry(
+        self,
+        key: str,
+        obj_path: str,
+        source_hash: str,
+        mtime_ns: int,
+        size: int,
+        cfg_digest: bytes,
+        deps_digest: str,
+    ) -> None:
+        """
+        mtime_ns/size come from the stat taken when the source was hashed,
+        so an edit made while it compiles still shows up next build.
+        """
+        self.set_entry(key, {
+            "obj": obj_path,
             "hash": source_hash,
+            "deps": deps_digest,
+            "mtime_ns": mtime_ns,
+            "size": size,
+            "cfg": cfg_digest.hex(),
             "timestamp": time.time(),
-        }
+        })
 
-    def needs_rebuild(self, obj_path: Path, source_hash: str) -> bool:
-        entry = self.get_entry(obj_path)
-        if entry is None:
+    def fast_check(
+        self,
+        key: str,
+        obj_path: str,
+        st: os.stat_result,
+        cfg_digest: bytes,
+        deps_digest: str,
+    ) -> Optional[bool]:
+        """
+        Make-style check on stat data alone.
+        Returns False if the source is certainly unchanged (no rebuild),
+        or None if the content hash has to decide.
+        """
+        entry = self.get_entry(key)
+        if entry is None or not self._has_object(entry, obj_path):
+            return None
+        if (
+            entry.get("mtime_ns") == st.st_mtime_ns
+            and entry.get("size") == st.st_size
+            and entry.get("cfg") == cfg_digest.hex()
+            and entry.get("deps") == deps_digest
+        ):
+            return False
+        return None
+
+    def needs_rebuild(self, key: str, obj_path: str, source_hash: str, deps_digest: str) -> bool:
+        entry = self.get_entry(key)
+        if entry is None or not self._has_object(entry, obj_path):
             return True
-        return entry.get("hash") != source_hash
+        return entry.get("hash") != source_hash or entry.get("deps") != deps_digest
+
+    @staticmethod
+    def _has_object(entry: Dict[str, Any], obj_path: str) -> bool:
+        # Entries are keyed by source, so an object built into another
+        # output_dir (or since deleted) doesn't count.
+        return entry.get("obj") == obj_path and os.path.exists(obj_path)
+
+
+class HeaderCache(PickleCache):
+    """
+    Sidecar cache of header digests, keyed by header path, so headers
+    shared by many TUs are hashed once and only re-hashed when their
+    stat data changes.
+    """
+
+    def __init__(self, path: Path):
+        super().__init__(path)
+        self._seen: Dict[str, str] = {}  # digests already checked this build
+
+    def digest(self, header: str) -> str:
+        # Called from the decision threads; a race only costs a redundant hash
+        seen = self._seen.get(header)
+        if seen is not None:
+            return seen
+        try:
+            st = os.stat(header)
+        except FileNotFoundError:
+            self._seen[header] = "missing"
+            return "missing"
+        entry = self.data.get(header)
+        if entry is not None and entry.get("mtime_ns") == st.st_mtime_ns and entry.get("size") == st.st_size:
+            digest = entry["hash"]
+        else:
+            digest = _content_digest(header, st.st_mtime_ns, st.st_size).hex()
+            self.set_entry(header, {
+                "hash": digest,
+                "mtime_ns": st.st_mtime_ns,
+                "size": st.st_size,
+            })
+        self._seen[header] = digest
+        return digest
+
+    def prune(self) -> None:
+        """Drops entries for headers that no `.d` file referenced this build."""
+        stale = [header for header in self.data if header not in self._seen]
+        for header in stale:
+            del self.data[header]
+        if stale:
+            self._dirty = True
 
 
 # --- Compiler worker (daemon-ish) ------------------------------------------
 
-def compiler_daemon(
+# (src, obj, hash, src mtime_ns, src size). Daemons only read src and obj;
+# the rest rides along so results need no lookup on the way back.
+CompileTask = Tuple[str, str, str, int, int]
+
+# Messages a compiler daemon pushes to result_q:
+#   (STDERR_MSG, tag, line)        one line of compiler stderr, as it arrives
+#   (DONE_MSG, task, returncode)   one per compile task
+STDERR_MSG = "stderr"
+DONE_MSG = "done"
+
+
+async def _run_compiler(
+    cmd: List[str],
+    tag: str,
+    result_q: Any,
+    cwd: Optional[Path] = None,
+) -> int:
+    """
+    Runs one compiler invocation, forwarding its stderr to result_q line
+    by line instead of buffering it until exit. With result_q None the
+    output is read and dropped.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=cwd,
+    )
+    assert proc.stderr is not None
+    try:
+        # Fixed-size reads and our own line splitting: StreamReader's line
+        # iteration raises on lines over its limit, and template
+        # diagnostics can be longer than any sensible limit.
+        pending = bytearray()
+        while chunk := await proc.stderr.read(STDERR_CHUNK_SIZE):
+            pending += chunk
+            end = pending.rfind(b"\n") + 1
+            if end:
+                if result_q is not None:
+                    for line in bytes(pending[:end]).split(b"\n")[:-1]:
+                        result_q.put((STDERR_MSG, tag, line + b"\n"))
+                del pending[:end]
+        if pending and result_q is not None:
+            result_q.put((STDERR_MSG, tag, bytes(pending)))
+        return await proc.wait()
+    finally:
+        if proc.returncode is None:
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass
+            await proc.wait()
+
+
+async def compiler_daemon(
     compiler_cmd: str,
     base_flags: List[str],
     profile_flags: List[str],
     include_dirs: List[str],
-    source: str,
-    obj_path: str,
-) -> Tuple[str, int, str]:
+    task: CompileTask,
+    result_q: Any,
+) -> Tuple[CompileTask, int]:
     """
-    This function runs in a separate process.
-    Think of it as a tiny compiler daemon that:
+    Runs inside a compiler daemon process (see compiler_daemon_loop):
     - receives a single compile task
-    - invokes clang++
-    - returns (source_path, returncode, stderr_output)
+    - invokes clang++, streaming its stderr to result_q (dropped if None)
+    - returns (task, returncode)
     """
+    source, obj_path = task[0], task[1]
     src = Path(source)
     obj = Path(obj_path)
-    obj.parent.mkdir(parents=True, exist_ok=True)
 
-    cmd = [compiler_cmd, "-c", str(src), "-o", str(obj)]
+    cmd = [compiler_cmd, "-c", str(src), "-o", str(obj), "-MD", "-MF", str(obj.with_suffix(".d"))]
     for inc in include_dirs:
         cmd.append(f"-I{inc}")
 
     cmd.extend(base_flags)
     cmd.extend(profile_flags)
 
-    proc = subprocess.run(
-        cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
+    returncode = await _run_compiler(cmd, source, result_q)
+    return (task, returncode)
+
+
+# Flags that take a path, which may be joined to them (-Iinclude)
+_PATH_FLAG_PREFIXES = (
+    "-include", "-imacros", "-isystem", "-iquote", "-idirafter", "-isysroot",
+    "-I", "-F", "-B", "-L",
+)
+
+
+def _has_relative_paths(flags: List[str]) -> bool:
+    """
+    True if any flag names an existing path relative to the project root:
+    as its own argument (-isystem third_party), joined to a path flag
+    (-Iinclude), after '=' or as an @response file. Batched compiles run
+    inside the object directory, where those paths don't resolve.
+    """
+    for arg in flags:
+        if arg.startswith("@"):
+            value = arg[1:]
+        elif not arg.startswith("-"):
+            value = arg
+        elif "=" in arg:
+            value = arg.split("=", 1)[1]
+        else:
+            value = next((arg[len(p):] for p in _PATH_FLAG_PREFIXES if arg.startswith(p)), "")
+        if value and not os.path.isabs(value) and os.path.exists(value):
+            return True
+    return False
+
+
+def _resolve_compiler(compiler_cmd: str) -> str:
+    """
+    Absolute path of the compiler, so batched compiles (which run inside
+    the object directory) find it. Left as-is if it can't be found; the
+    compile then reports that.
+    """
+    if os.sep in compiler_cmd or (os.altsep and os.altsep in compiler_cmd):
+        return os.path.abspath(compiler_cmd)
+    found = shutil.which(compiler_cmd)
+    return os.path.abspath(found) if found else compiler_cmd
+
+
+def _mtime_ns(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+async def compiler_daemon_batch(
+    compiler_cmd: str,
+    base_flags: List[str],
+    profile_flags: List[str],
+    include_dirs: List[str],
+    batch: List[CompileTask],
+    result_q: Any,
+) -> List[Tuple[CompileTask, int]]:
+    """
+    Compiles several tasks with one compiler invocation, amortizing driver
+    startup. Returns one (task, returncode) per task.
+
+    With multiple inputs `-o` can't be used, so the compiler runs inside
+    the object directory and writes `<stem>.o` there (which is exactly how
+    object paths are named). Sources and include dirs are made absolute
+    for that; base flags with relative paths never get here (see
+    _run_parallel_compilers). Independent inputs keep compiling after one
+    fails, so on error only sources whose object wasn't rewritten are
+    re-run one by one, isolating the bad TU. Their diagnostics have
+    already been streamed under a `batch: ...` tag listing every source,
+    so the re-run's output is dropped rather than shown twice.
+    """
+    obj_dir = Path(batch[0][1]).parent
+    batchable = len(batch) > 1 and all(
+        Path(task[1]) == obj_dir / Path(task[0]).with_suffix(".o").name
+        for task in batch
     )
-    return (source, proc.returncode, proc.stderr)
+    if not batchable:
+        return [
+            await compiler_daemon(
+                compiler_cmd, base_flags, profile_flags, include_dirs, task, result_q
+            )
+            for task in batch
+        ]
+
+    before = [_mtime_ns(task[1]) for task in batch]
+
+    cmd = [compiler_cmd, "-c", "-MD"]  # writes <stem>.d next to each object
+    cmd.extend(os.path.abspath(task[0]) for task in batch)
+    for inc in include_dirs:
+        cmd.append(f"-I{os.path.abspath(inc)}")
+
+    cmd.extend(base_flags)
+    cmd.extend(profile_flags)
+
+    # One stream covers every source, so don't pin it on any one of them
+    tag = "batch: " + ", ".join(task[0] for task in batch)
+    returncode = await _run_compiler(cmd, tag, result_q, cwd=obj_dir)
+    if returncode == 0:
+        return [(task, 0) for task in batch]
+
+    results = []
+    for task, mtime_before in zip(batch, before):
+        mtime_ns = _mtime_ns(task[1])
+        if mtime_ns is not None and mtime_ns != mtime_before:
+            results.append((task, 0))
+        else:
+            results.append(await compiler_daemon(
+                compiler_cmd, base_flags, profile_flags, include_dirs, task, None
+            ))
+    return results
+
+
+def compiler_daemon_loop(
+    task_q: Any,
+    result_q: Any,
+    compiler_cmd: str,
+    base_flags: List[str],
+    profile_flags: List[str],
+    include_dirs: List[str],
+) -> None:
+    """
+    Body of a persistent compiler daemon process.
+    Spawned once per build, it keeps pulling batches of compile tasks
+    from task_q until it sees None, streaming stderr lines and one
+    DONE_MSG per task to result_q.
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        while True:
+            batch = task_q.get()
+            if batch is None:
+                break
+            try:
+                results = loop.run_until_complete(compiler_daemon_batch(
+                    compiler_cmd, base_flags, profile_flags, include_dirs, batch, result_q
+                ))
+            except Exception as e:
+                message = f"Compiler daemon error: {e}\n".encode("utf-8")
+                for task in batch:
+                    result_q.put((STDERR_MSG, task[0], message))
+                results = [(task, -1) for task in batch]
+            for task, returncode in results:
+                result_q.put((DONE_MSG, task, returncode))
+    finally:
+        loop.close()
 
 
 # --- Builder core -----------------------------------------------------------
 
+
 class ForgeBuilder:
     def __init__(self, config: BuildConfig):
         self.config = config
         self.output_dir = Path(config.output_dir)
         self.cache = BuildCache(Path(CACHE_FILE))
+        self.header_cache = HeaderCache(Path(HEADER_CACHE_FILE))
 
     # -- public commands -----------------------------------------------------
 
@@ -292,6 +689,9 @@ class ForgeBuilder:
         if Path(CACHE_FILE).exists():
             log(colored(f"Removing cache file: {CACHE_FILE}", "yellow"))
             Path(CACHE_FILE).unlink()
+        if Path(HEADER_CACHE_FILE).exists():
+            log(colored(f"Removing header cache file: {HEADER_CACHE_FILE}", "yellow"))
+            Path(HEADER_CACHE_FILE).unlink()
         log(colored("Clean complete.", "green"))
 
     def build(self, force_rebuild: bool = False, jobs: Optional[int] = None) -> None:
@@ -302,34 +702,46 @@ class ForgeBuilder:
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
         obj_files: List[Path] = []
-        compile_tasks: List[Tuple[str, str, str]] = []  # (src, obj, hash)
+        compile_tasks: List[CompileTask] = []
 
         include_dirs = self.config.include_dirs
-        base_flags = self.config.compiler_base_flags
+        base_flags = self._compile_base_flags()
         profile_flags = self.config.profile.flags
+        cfg_digest = _compute_cfg_digest(
+            self.config.compiler_cmd, base_flags, profile_flags, include_dirs
+        )
 
-        # 1. Decide which sources need to be rebuilt
-        for src_str in self.config.cpp_sources:
-            src_path = Path(src_str)
-            if not src_path.exists():
-                log(colored(f"Error: Source file not found: {src_path}", "red"))
+        # 1. Decide which sources need to be rebuilt (stat/hash in a thread pool)
+        decisions: List[Optional[Tuple[Optional[CompileTask], str]]] = []
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as pool:
+            future_index = {}
+            for index, (src, (src_path, key)) in enumerate(
+                zip(self.config.cpp_sources, self.config.resolved_sources)
+            ):
+                obj_name = src.with_suffix(".o").name  # from the configured path
+                obj_path = self.output_dir / obj_name
+                obj_files.append(obj_path)
+                decisions.append(None)
+                future = pool.submit(self._decide, src_path, key, obj_path, cfg_digest, force_rebuild)
+                future_index[future] = index
+
+            for future in as_completed(future_index):
+                decisions[future_index[future]] = future.result()
+
+        # Flush in declaration order so the log reads the same as a serial run;
+        # a missing source is reported here, in order (see _decide)
+        for (_, key), decision in zip(self.config.resolved_sources, decisions):
+            if decision is None:
+                log(colored(f"Error: Source file not found: {key}", "red"))
                 sys.exit(1)
+            task, msg = decision
+            log(msg)
+            if task is not None:
+                compile_tasks.append(task)
 
-            obj_name = src_path.with_suffix(".o").name
-            obj_path = self.output_dir / obj_name
-            obj_files.append(obj_path)
-
-            source_hash = hash_source(src_path, base_flags, profile_flags, include_dirs)
-
-            if force_rebuild or self.cache.needs_rebuild(obj_path, source_hash):
-                log(f"{colored('compile', 'blue')}: {src_path} -> {obj_path}")
-                compile_tasks.append((str(src_path), str(obj_path), source_hash))
-            else:
-                log(f"{colored('cached ', 'green')}: {src_path}")
-
-        # 2. Parallel compilation via ProcessPoolExecutor
+        # 2. Parallel compilation via persistent compiler daemons
         if compile_tasks:
-            self._run_parallel_compilers(compile_tasks, jobs)
+            self._run_parallel_compilers(compile_tasks, jobs, cfg_digest)
         else:
             log(colored("Nothing to compile. Everything is up to date.", "green"))
 
@@ -338,53 +750,191 @@ class ForgeBuilder:
 
         # 4. Save cache
         self.cache.save()
+        self.header_cache.prune()
+        self.header_cache.save()
         log(colored("Build finished successfully.", "green"))
 
     # -- internals -----------------------------------------------------------
 
+    def _compile_base_flags(self) -> List[str]:
+        """
+        Base flags for compiling (not linking). With [compiler].modules, all
+        daemons share one implicit module cache (clang locks it per module).
+        """
+        flags = list(self.config.compiler_base_flags)
+        if self.config.modules_enabled:
+            modcache = (self.output_dir / ".modcache").resolve()
+            flags[:0] = ["-fmodules", "-fimplicit-module-maps", f"-fmodules-cache-path={modcache}"]
+        return flags
+
+    def _decide(
+        self,
+        src_path: Path,
+        key: str,
+        obj_path: Path,
+        cfg_digest: bytes,
+        force_rebuild: bool,
+    ) -> Optional[Tuple[Optional[CompileTask], str]]:
+        """
+        Runs in a worker thread. Returns (compile_task or None, log message),
+        or None if the source does not exist. Tasks carry the cache key as
+        source path; it is valid relative to the project root.
+        """
+        # One stat answers existence, the fast check, the cache entry and
+        # the size used for scheduling.
+        try:
+            st = os.stat(src_path)
+        except FileNotFoundError:
+            return None
+
+        if force_rebuild:
+            source_hash = hash_source(src_path, key, cfg_digest, st.st_mtime_ns, st.st_size)
+            task = (key, str(obj_path), source_hash, st.st_mtime_ns, st.st_size)
+            return task, f"{colored('compile', 'blue')}: {key} -> {obj_path}"
+
+        obj = str(obj_path)
+        deps_digest = self._deps_digest(obj)
+        if self.cache.fast_check(key, obj, st, cfg_digest, deps_digest) is False:
+            return None, f"{colored('cached ', 'green')}: {key}"
+
+        source_hash = hash_source(src_path, key, cfg_digest, st.st_mtime_ns, st.st_size)
+
+        if self.cache.needs_rebuild(key, obj, source_hash, deps_digest):
+            task = (key, obj, source_hash, st.st_mtime_ns, st.st_size)
+            return task, f"{colored('compile', 'blue')}: {key} -> {obj_path}"
+
+        # Contents unchanged but stat data moved on (touch, checkout):
+        # refresh the entry so the next build takes the fast path.
+        self.cache.update_entry(key, obj, source_hash, st.st_mtime_ns, st.st_size, cfg_digest, deps_digest)
+        return None, f"{colored('cached ', 'green')}: {key}"
+
+    def _deps_digest(self, obj_path: str) -> str:
+        """
+        Digest of the headers listed in the object's `.d` file from its last
+        compile, so header edits trigger a rebuild. Empty if there is none yet.
+        """
+        dep_path = os.path.splitext(obj_path)[0] + ".d"
+        try:
+            headers = parse_dep_file(dep_path)
+        except FileNotFoundError:
+            return ""
+        h = hashlib.blake2b(digest_size=16)
+        for header in headers:
+            h.update(header.encode("utf-8"))
+            h.update(self.header_cache.digest(header).encode("utf-8"))
+        return h.hexdigest()
+
     def _run_parallel_compilers(
         self,
-        tasks: List[Tuple[str, str, str]],
+        tasks: List[CompileTask],
         jobs: Optional[int],
+        cfg_digest: bytes,
     ) -> None:
         if jobs is None or jobs <= 0:
             jobs = os.cpu_count() or 1
 
         log(colored(f"Spawning up to {jobs} compiler daemons...", "magenta"))
 
+        # Longest-first: compile time tracks TU size, so starting the biggest
+        # sources first keeps one giant file from becoming the tail.
+        tasks = sorted(tasks, key=lambda t: -t[4])
+
+        # Up to MAX_BATCH_SIZE sources per compiler invocation, but never fewer
+        # batches than daemons. Dealing the size-sorted list out serpentine
+        # (0..n-1, then n-1..0) gives every batch a similar total size.
+        # Batches run inside the object directory, so flags naming relative
+        # paths (-Iinclude, -include pch.h) force one source per invocation.
+        base_flags = self._compile_base_flags()
+        if _has_relative_paths(base_flags):
+            batch_size = 1
+        else:
+            batch_size = max(1, min(MAX_BATCH_SIZE, math.ceil(len(tasks) / jobs)))
+        n_batches = math.ceil(len(tasks) / batch_size)
+        batches: List[List[CompileTask]] = [[] for _ in range(n_batches)]
+        for i, task in enumerate(tasks):
+            rnd, pos = divmod(i, n_batches)
+            batches[pos if rnd % 2 == 0 else n_batches - 1 - pos].append(task)
+
+        # Daemons expect object directories to exist; usually this is one
+        # directory, so create them here once instead of per task.
+        for obj_dir in {os.path.dirname(obj) for _, obj, *_ in tasks}:
+            os.makedirs(obj_dir or ".", exist_ok=True)
+
         errors = False
+        finished = set()
 
-        with ProcessPoolExecutor(max_workers=jobs) as executor:
-            future_map = {
-                executor.submit(
-                    compiler_daemon,
-                    self.config.compiler_cmd,
-                    self.config.compiler_base_flags,
+        # fork lets the daemons skip re-importing this module; Windows only has spawn
+        if "fork" in multiprocessing.get_all_start_methods():
+            ctx = multiprocessing.get_context("fork")
+        else:
+            ctx = multiprocessing.get_context()
+        task_q = ctx.Queue()
+        result_q = ctx.Queue()
+
+        daemons = [
+            ctx.Process(
+                target=compiler_daemon_loop,
+                args=(
+                    task_q,
+                    result_q,
+                    _resolve_compiler(self.config.compiler_cmd),
+                    base_flags,
                     self.config.profile.flags,
                     self.config.include_dirs,
-                    src,
-                    obj,
-                ): (src, obj, hsh)
-                for src, obj, hsh in tasks
-            }
-
-            for future in as_completed(future_map):
-                src, obj, hsh = future_map[future]
-                try:
-                    source, returncode, stderr_output = future.result()
-                except Exception as e:
-                    log(colored(f"Compiler daemon crashed for {src}: {e}", "red"))
-                    errors = True
+                ),
+                daemon=True,
+            )
+            for _ in range(min(jobs, len(batches)))
+        ]
+        for proc in daemons:
+            proc.start()
+
+        for batch in batches:
+            task_q.put(batch)
+        for _ in daemons:
+            task_q.put(None)
+
+        stderr_raw = getattr(sys.stderr, "buffer", None)
+        remaining = len(tasks)
+        while remaining:
+            try:
+                kind, first, second = result_q.get(timeout=1.0)
+            except queue.Empty:
+                if any(proc.is_alive() for proc in daemons):
                     continue
-
-                if returncode != 0:
-                    log(colored(f"Compilation failed for {source}", "red"))
-                    if stderr_output.strip():
-                        print(stderr_output, file=sys.stderr)
-                    errors = True
+                for src, *_ in tasks:
+                    if src not in finished:
+                        log(colored(f"Compiler daemon crashed for {src}", "red"))
+                errors = True
+                break
+
+            if kind == STDERR_MSG:
+                tag, line = first, second
+                if not line.endswith(b"\n"):
+                    line += b"\n"
+                if stderr_raw is not None:
+                    # Pass compiler bytes through untouched, like make/ninja
+                    stderr_raw.write(b"[" + tag.encode("utf-8") + b"] " + line)
+                    stderr_raw.flush()
                 else:
-                    log(colored(f"Compiled: {source}", "green"))
-                    self.cache.update_entry(Path(obj), hsh)
+                    text = line.decode("utf-8", errors="replace").rstrip("\r\n")
+                    print(f"[{tag}] {text}", file=sys.stderr)
+                continue
+
+            (source, obj, hsh, mtime_ns, size), returncode = first, second
+            remaining -= 1
+            finished.add(source)
+            if returncode != 0:
+                log(colored(f"Compilation failed for {source}", "red"))
+                errors = True
+            else:
+                log(colored(f"Compiled: {source}", "green"))
+                # The fresh .d reflects this compile's includes
+                deps_digest = self._deps_digest(obj)
+                self.cache.update_entry(source, obj, hsh, mtime_ns, size, cfg_digest, deps_digest)
+
+        for proc in daemons:
+            proc.join()
 
         if errors:
             log(colored("Errors occurred during compilation. Aborting before link.", "red"))
@@ -403,30 +953,66 @@ class ForgeBuilder:
                 binary_name = binary_name + ".exe"
         output_binary = self.output_dir / binary_name
 
-        log(colored(f"Linking -> {output_binary}", "magenta"))
-
         cmd = [self.config.compiler_cmd]
         cmd.extend(str(obj) for obj in obj_files)
         cmd.extend(self.config.compiler_base_flags)
         cmd.extend(self.config.profile.flags)
         cmd.extend(["-o", str(output_binary)])
 
+        # Skip the link if the command and every object's stat data match the
+        # last successful link and its output is still the one we produced.
+        link_key = self._link_key(cmd, obj_files)
+        entry = self.cache.get_entry(LINK_CACHE_KEY)
+        if (
+            link_key is not None
+            and entry is not None
+            and entry.get("key") == link_key
+            and entry.get("output") == str(output_binary)
+            and _mtime_ns(str(output_binary)) == entry.get("mtime_ns")
+        ):
+            log(colored(f"Link up to date: {output_binary}", "green"))
+            return
+
+        log(colored(f"Linking -> {output_binary}", "magenta"))
+
         proc = subprocess.run(
             cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
         )
 
         if proc.returncode != 0:
             log(colored("Linking failed.", "red"))
-            if proc.stderr.strip():
-                print(proc.stderr, file=sys.stderr)
+            # Only decoded when there is something to show
+            stderr_output = proc.stderr.decode("utf-8", errors="replace")
+            if stderr_output.strip():
+                print(stderr_output, file=sys.stderr)
             sys.exit(1)
 
+        if link_key is not None:
+            self.cache.set_entry(LINK_CACHE_KEY, {
+                "key": link_key,
+                "output": str(output_binary),
+                "mtime_ns": _mtime_ns(str(output_binary)),
+            })
+
         log(colored("Linking successful.", "green"))
         log(colored(f"Output binary: {output_binary}", "cyan"))
 
+    @staticmethod
+    def _link_key(cmd: List[str], obj_files: List[Path]) -> Optional[str]:
+        h = hashlib.blake2b(digest_size=16)
+        for arg in cmd:
+            h.update(arg.encode("utf-8"))
+            h.update(b"\0")
+        for obj in obj_files:
+            try:
+                st = os.stat(obj)
+            except FileNotFoundError:
+                return None  # let the linker report it
+            h.update(f"{st.st_mtime_ns}:{st.st_size}\0".encode("utf-8"))
+        return h.hexdigest()
+
 
 # --- Wrapper install logic --------------------------------------------------
 
@@ -450,13 +1036,7 @@ def install_wrapper_scripts(project_root: Path) -> None:
     # Unix shell wrapper (forgew)
     wrapper_sh = project_root / WRAPPER_SH
     if not wrapper_sh.exists():
-        wrapper_sh_contents = f"""#!/usr/bin/env sh
-# ForgeBuild_2 wrapper (Unix-like)
-DIR="$(CDPATH= cd -- "$(dirname "$0")" && pwd)"
-PYTHON="${{PYTHON:-python3}}"
-exec "$PYTHON" "$DIR/{WRAPPER_DIR}/{WRAPPER_SCRIPT_NAME}" "$@"
-"""
-        wrapper_sh.write_text(wrapper_sh_contents, encoding="utf-8")
+        wrapper_sh.write_bytes(_WRAPPER_SH_BYTES)
         wrapper_sh.chmod(wrapper_sh.stat().st_mode | 0o111)  # make executable
         log(colored(f"Created Unix wrapper script: {wrapper_sh}", "green"))
     else:
@@ -465,16 +1045,7 @@ exec "$PYTHON" "$DIR/{WRAPPER_DIR}/{WRAPPER_SCRIPT_NAME}" "$@"
     # Windows batch wrapper (forgew.bat)
     wrapper_bat = project_root / WRAPPER_BAT
     if not wrapper_bat.exists():
-        wrapper_bat_contents = f"""@echo off
-REM ForgeBuild_2 wrapper (Windows)
-setlocal
-set DIR=%~dp0
-set PYTHON=%PYTHON%
-if "%PYTHON%"=="" set PYTHON=python
-"%PYTHON%" "%DIR%{WRAPPER_DIR}\\{WRAPPER_SCRIPT_NAME}" %*
-endlocal
-"""
-        wrapper_bat.write_text(wrapper_bat_contents, encoding="utf-8")
+        wrapper_bat.write_bytes(_WRAPPER_BAT_BYTES)
         log(colored(f"Created Windows wrapper script: {wrapper_bat}", "green"))
     else:
         log(colored(f"Windows wrapper script {wrapper_bat} already exists. Not overwriting.", "yellow"))
@@ -506,6 +1077,8 @@ cpp = [
 command = "clang++"
 # Extra flags applied to all builds (debug + release)
 flags = ["-Wall", "-std=c++20"]
+# Share parsed headers between TUs through clang's module cache
+# modules = true
 
 [paths]
 include_dirs = ["include"]